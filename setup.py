@@ -0,0 +1,21 @@
+"""Build script.
+
+The project metadata lives in `pyproject.toml`. This script only adds the
+optional Cython build of `demo.serialization`: when Cython is importable at
+build time (e.g. `pip install --no-build-isolation .` with Cython installed)
+the module is compiled, otherwise the pure Python module is used unchanged.
+"""
+
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    ext_modules = []
+else:
+    ext_modules = cythonize(
+        ['src/demo/serialization.py'],
+        language_level=3
+    )
+
+setup(ext_modules=ext_modules)
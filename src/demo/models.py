@@ -4,11 +4,11 @@ from typing import Annotated
 
 from pydantic import (
     BaseModel,
-    PlainSerializer,
-    PlainValidator
+    ConfigDict,
+    PlainSerializer
 )
 
-from .serialization import serialize_model, validate_model
+from .serialization import ModelValidator, serialize_model
 
 
 class User(BaseModel):
@@ -29,8 +29,10 @@ class Address(BaseModel):
 
 
 class Update[T: BaseModel](BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     model: Annotated[
         T,
         PlainSerializer(serialize_model),
-        PlainValidator(validate_model)
+        ModelValidator()
     ]
@@ -1,10 +1,125 @@
+from functools import lru_cache
 import json
 import importlib
+import re
+import sys
+from typing import Any, Callable, Iterable, TypeVar
 
-from pydantic import BaseModel, ValidationInfo
+from pydantic import (
+    BaseModel,
+    GetCoreSchemaHandler,
+    PlainValidator,
+    SerializationInfo,
+    ValidationError,
+    ValidationInfo
+)
+from pydantic.fields import FieldInfo
+from pydantic_core import CoreSchema
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def serialize_model(model: BaseModel) -> dict:
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+if msgspec is not None:
+    _MSGPACK_ENCODER = msgspec.msgpack.Encoder()
+    _MSGPACK_DECODER = msgspec.msgpack.Decoder(dict)
+
+_ENVELOPE_PREFIX = b'{"$t":"'
+_ENVELOPE_SEPARATOR = b'","v":'
+
+# The metadata of the earlier format, where it is the last two keys of the root
+# model.
+_ROOT_METADATA = re.compile(
+    rb'"__module__"\s*:\s*"([^"\\]*)"\s*,\s*"__qualname__"\s*:\s*"([^"\\]*)"\s*}\s*'
+)
+
+_CLASS_TAGS: dict[type, tuple[str, str, bytes]] = {}
+
+_ENCODERS: dict[type, Callable[[BaseModel], bytes]] = {}
+
+ModelValidatorFunction = Callable[[Any, ValidationInfo], BaseModel]
+
+_MODEL_VALIDATORS: dict[type, ModelValidatorFunction] = {}
+
+
+def _class_tag(cls: type[BaseModel]) -> tuple[str, str, bytes]:
+    """Get the metadata for a model class.
+
+    The metadata is computed once per class and cached.
+
+    Args:
+        cls (type[BaseModel]): The model class.
+
+    Returns:
+        tuple[str, str, bytes]: The interned module name and qualified name,
+            and the JSON envelope header up to the start of the payload.
+    """
+    tag = _CLASS_TAGS.get(cls)
+    if tag is None:
+        module = sys.intern(cls.__module__)
+        qualname = sys.intern(cls.__qualname__)
+        header = (
+            _ENVELOPE_PREFIX +
+            f'{module}:{qualname}'.encode('utf-8') +
+            _ENVELOPE_SEPARATOR
+        )
+        tag = _CLASS_TAGS[cls] = (module, qualname, header)
+    return tag
+
+
+def _make_encoder(cls: type[BaseModel]) -> Callable[[BaseModel], bytes]:
+    """Make a JSON envelope encoder specialized for a model class.
+
+    The envelope header and the pydantic-core serializer of the class are
+    bound into the encoder, so encoding a model is a single call to the
+    serializer. Encoders are cached once the class is fully built.
+
+    Args:
+        cls (type[BaseModel]): The model class.
+
+    Returns:
+        Callable[[BaseModel], bytes]: The encoder.
+    """
+    _, _, header = _class_tag(cls)
+    to_json = cls.__pydantic_serializer__.to_json
+
+    def encode(model: BaseModel) -> bytes:
+        return header + to_json(model) + b'}'
+
+    if cls.__pydantic_complete__:
+        _ENCODERS[cls] = encode
+    return encode
+
+
+def _serialize_model(model: BaseModel, json_compatible: bool) -> dict:
+    """Serialize a Pydantic model to a dictionary with metadata.
+
+    Args:
+        model (BaseModel): The model to serialize.
+        json_compatible (bool): If true the values are JSON serializable,
+            otherwise they keep their python types (e.g. `datetime`).
+
+    Returns:
+        dict: A python dictionary representation of the model including the
+            metadata.
+    """
+    module, qualname, _ = _class_tag(model.__class__)
+    dct = model.__pydantic_serializer__.to_python(
+        model,
+        mode='json' if json_compatible else 'python'
+    )
+    dct['__module__'] = module
+    dct['__qualname__'] = qualname
+    return dct
+
+
+def serialize_model(model: BaseModel, info: SerializationInfo) -> dict:
     """Serialize a Pydantic model to a dictionary.
 
     Two fields are added to the root level of the dictionary:
@@ -14,55 +129,220 @@ def serialize_model(model: BaseModel) -> dict:
     This allows the model to be deserialized later by importing the module
     and using the qualified name to get the class.
 
-    This can be used in combination with `validate_model` in the following way:
+    This can be used in combination with `ModelValidator` in the following way:
 
     ```python
     class Update[T: BaseModel](BaseModel):
         model: Annotated[
             T,
             PlainSerializer(serialize_model),
-            PlainValidator(validate_model)
+            ModelValidator()
         ]
     ```
 
+    The values follow the mode of the enclosing serialization, so a python
+    mode dump (e.g. `model_dump()`) keeps python types rather than converting
+    them to strings which must be parsed again when the dictionary is
+    validated.
+
     Args:
         model (BaseModel): The model to serialize.
+        info (SerializationInfo): Information about the serialization state.
 
     Returns:
         dict: A python dictionary representation of the model where the
-            keys are strings and the values are JSON serializable. Metadata
-            about the model is included in the dictionary.
+            keys are strings. Metadata about the model is included in the
+            dictionary.
     """
-    dct = model.model_dump(mode='json')
-    dct['__module__'] = model.__class__.__module__
-    dct['__qualname__'] = model.__class__.__qualname__
+    # This repeats `_serialize_model` rather than calling it, as it runs for
+    # every field serialization.
+    module, qualname, _ = _class_tag(model.__class__)
+    dct = model.__pydantic_serializer__.to_python(
+        model,
+        mode='json' if info.mode_is_json() else 'python'
+    )
+    dct['__module__'] = module
+    dct['__qualname__'] = qualname
     return dct
 
 
-def _deserialize_model(dct: dict) -> BaseModel:
+@lru_cache(maxsize=1024)
+def _resolve_class(module: str, qualname: str) -> type[BaseModel]:
+    """Resolve a model class from its module and qualified name.
+
+    The result is cached, as this is called for every model deserialized.
+
+    Args:
+        module (str): The name of the module where the class is defined.
+        qualname (str): The qualified name of the class, which may be dotted
+            for nested classes.
+
+    Raises:
+        ValueError: If the name cannot be resolved, or does not refer to a
+            pydantic model class.
+
+    Returns:
+        type[BaseModel]: The model class.
+    """
+    try:
+        obj = importlib.import_module(module)
+        for part in qualname.split('.'):
+            obj = getattr(obj, part)
+    except (ImportError, AttributeError) as error:
+        raise ValueError(
+            f"cannot resolve model: {module}.{qualname}"
+        ) from error
+    if not (isinstance(obj, type) and issubclass(obj, BaseModel)):
+        raise ValueError(f"not a pydantic model: {module}.{qualname}")
+    return obj
+
+
+def _resolve_tag(tag: str) -> type[BaseModel]:
+    """Resolve a model class from an envelope type tag.
+
+    Args:
+        tag (str): The type tag in the form `"module:qualname"`.
+
+    Raises:
+        ValueError: If the tag is malformed or cannot be resolved.
+
+    Returns:
+        type[BaseModel]: The model class.
+    """
+    module, separator, qualname = tag.partition(':')
+    if not separator:
+        raise ValueError(f"invalid type tag: {tag}")
+    return _resolve_class(module, qualname)
+
+
+def _split_envelope(data: bytes | bytearray) -> tuple[bytes, bytes] | None:
+    """Split an envelope written by `serialize_model_to_json_bytes`.
+
+    Args:
+        data (bytes | bytearray): The JSON data.
+
+    Returns:
+        tuple[bytes, bytes] | None: The type tag and the JSON model payload,
+            or `None` if the data is not in the compact envelope format.
+    """
+    if not (data.startswith(_ENVELOPE_PREFIX) and data.endswith(b'}')):
+        return None
+    start = len(_ENVELOPE_PREFIX)
+    end = data.find(_ENVELOPE_SEPARATOR, start)
+    if end == -1:
+        return None
+    return data[start:end], data[end + len(_ENVELOPE_SEPARATOR):-1]
+
+
+def _json_loads(data: str | bytes | bytearray) -> Any:
+    """Parse JSON with orjson if it is available, otherwise the json module."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _has_model_metadata(dct: dict) -> bool:
+    """Check if a dictionary carries model metadata or is an envelope."""
+    return (
+        ('$t' in dct and 'v' in dct) or
+        ('__module__' in dct and '__qualname__' in dct)
+    )
+
+
+def _is_model_field(field: FieldInfo) -> bool:
+    """Check if a field holds a pydantic model.
+
+    This is true for fields annotated with a `BaseModel` subclass or a type
+    variable, or validated with `ModelValidator`.
+    """
+    annotation = field.annotation
+    return (
+        (isinstance(annotation, type) and issubclass(annotation, BaseModel)) or
+        isinstance(annotation, TypeVar) or
+        any(isinstance(item, ModelValidator) for item in field.metadata)
+    )
+
+
+def _construct_model(cls: type[BaseModel], dct: dict) -> BaseModel:
+    """Construct a model from trusted data without validation.
+
+    Dictionaries assigned to fields which hold models (see `_is_model_field`)
+    are constructed recursively, using the model metadata if present. Other
+    values, including dictionaries in plain `dict` fields, are kept as is.
+
+    Args:
+        cls (type[BaseModel]): The model class.
+        dct (dict): The field values.
+
+    Returns:
+        BaseModel: The constructed model.
+    """
+    values = {}
+    for name, value in dct.items():
+        field = cls.model_fields.get(name)
+        if (
+                isinstance(value, dict) and
+                field is not None and
+                _is_model_field(field)
+        ):
+            annotation = field.annotation
+            if _has_model_metadata(value):
+                value = _deserialize_model(value, trusted=True)
+            elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+                value = _construct_model(annotation, value)
+        values[name] = value
+    return cls.model_construct(**values)
+
+
+def _deserialize_model(dct: dict, trusted: bool = False) -> BaseModel:
     """This function deserializes a dictionary into a Pydantic model.
 
     It uses the `__module__` and `__qualname__` keys in the dictionary to
-    import the module and get the class.
+    import the module and get the class. Envelopes, as written by
+    `serialize_model_to_json_bytes`, are also accepted, in which case the
+    class is resolved from the `$t` tag and the model is read from `v`. The
+    dictionary is not modified.
+
+    When `trusted` is set the model is built with `model_construct`, skipping
+    validation entirely. This is only safe for data produced in-process from
+    models of the same classes: values are not coerced, so they must already
+    be of the declared field types (e.g. a `datetime` rather than its ISO
+    string), and invalid data will not be detected.
 
     Args:
         dct (dict): The dictionary to deserialize.
+        trusted (bool, optional): If true, skip validation. Defaults to False.
+
+    Raises:
+        ValueError: If the dictionary has no model metadata.
 
     Returns:
         BaseModel: The deserialized Pydantic model.
     """
-    module = dct.pop('__module__')
-    qualname = dct.pop('__qualname__')
-    cls = getattr(importlib.import_module(module), qualname)
-    model = cls.model_validate(dct)
+    if '$t' in dct and 'v' in dct:
+        cls = _resolve_tag(dct['$t'])
+        payload = dct['v']
+    elif '__module__' in dct and '__qualname__' in dct:
+        cls = _resolve_class(dct['__module__'], dct['__qualname__'])
+        payload = {
+            key: value
+            for key, value in dct.items()
+            if key != '__module__' and key != '__qualname__'
+        }
+    else:
+        raise ValueError("missing model metadata")
+    if trusted:
+        return _construct_model(cls, payload)
+    model = cls.model_validate(payload)
     return model
 
 
 def serialize_model_to_json(model: BaseModel) -> str:
     """Serialize a Pydantic model to a JSON string.
 
-    The serialization will inject metadata whenever it encounters a pydantic
-    `BaseModel` allowing deserialization by `deserialize_model_from_json`.
+    The root model is wrapped in an envelope of the form
+    `{"$t": "module:qualname", "v": <model>}`, and metadata is injected
+    whenever a nested pydantic `BaseModel` is serialized with
+    `serialize_model`, allowing deserialization by
+    `deserialize_model_from_json`.
 
     Args:
         model (BaseModel): The model to serialize.
@@ -70,25 +350,241 @@ def serialize_model_to_json(model: BaseModel) -> str:
     Returns:
         str: A JSON string representation of the model.
     """
-    dct = serialize_model(model)
-    return json.dumps(dct)
+    return serialize_model_to_json_bytes(model).decode('utf-8')
+
+
+def serialize_model_to_json_bytes(model: BaseModel) -> bytes:
+    """Serialize a Pydantic model to UTF-8 encoded JSON bytes.
+
+    This is the same as `serialize_model_to_json`, but avoids the round trip
+    through `str` when the destination wants bytes (e.g. a socket or a
+    message queue).
+
+    The model is encoded directly by pydantic-core and placed in the envelope
+    without being re-parsed, so no intermediate python dictionary is built for
+    the root model.
+
+    Args:
+        model (BaseModel): The model to serialize.
+
+    Returns:
+        bytes: A JSON representation of the model.
+    """
+    encode = _ENCODERS.get(model.__class__)
+    if encode is None:
+        encode = _make_encoder(model.__class__)
+    return encode(model)
 
 
 def deserialize_model_from_json(data: str | bytes | bytearray) -> BaseModel:
     """Deserialize a model from a JSON string.
 
+    Envelopes written by `serialize_model_to_json_bytes` are split without
+    parsing, and the model payload is handed straight to pydantic-core with
+    `model_validate_json`, so no intermediate python dictionary is built for
+    the root model.
+
+    The earlier format, with the metadata stored as the last keys of the root
+    model, is handled in the same way: the metadata is read from the end of
+    the data and elided before validating the remainder. Anything else (e.g.
+    indented envelopes) is parsed in full.
+
     Args:
         data (str | bytes | bytearray): The JSON string to deserialize.
 
     Returns:
         BaseModel: The deserialized Pydantic model.
     """
-    dct = json.loads(data)
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+
+    envelope = _split_envelope(data)
+    if envelope is not None:
+        tag, payload = envelope
+        cls = _resolve_tag(tag.decode('utf-8'))
+        try:
+            return cls.model_validate_json(payload)
+        except ValidationError as error:
+            # The split assumes "v" is the last key. If the payload is not a
+            # single JSON value the envelope has another layout, so fall
+            # through to the full parse.
+            if not any(
+                    detail['type'] == 'json_invalid' and not detail['loc']
+                    for detail in error.errors()
+            ):
+                raise
+
+    start = data.rfind(b'"__module__"')
+    if start != -1 and (match := _ROOT_METADATA.fullmatch(data, start)):
+        cls = _resolve_class(match[1].decode('utf-8'), match[2].decode('utf-8'))
+        head = data[:start].rstrip()
+        if head.endswith(b','):
+            head = head[:-1]
+        return cls.model_validate_json(head + b'}')
+
+    dct = _json_loads(data)
+    model = _deserialize_model(dct)
+    return model
+
+
+def deserialize_many(
+        frames: Iterable[bytes | bytearray],
+        cls: type[BaseModel]
+) -> list[BaseModel]:
+    """Deserialize a batch of models of the same class.
+
+    As the class is known in advance, the type tags are checked against the
+    class with a single comparison and no class resolution. Each payload is
+    validated separately, so a malformed frame cannot change the number of
+    models returned, and any error is reported for that frame.
+
+    Args:
+        frames (Iterable[bytes | bytearray]): The JSON data, as written by
+            `serialize_model_to_json_bytes`.
+        cls (type[BaseModel]): The class of the models.
+
+    Raises:
+        ValueError: If a frame is not an envelope for the class.
+        ValidationError: If the payload of a frame is invalid.
+
+    Returns:
+        list[BaseModel]: The deserialized Pydantic models.
+    """
+    _, _, header = _class_tag(cls)
+    start = len(header)
+    models = []
+    for frame in frames:
+        if not (frame.startswith(header) and frame.endswith(b'}')):
+            raise ValueError(f"frame is not an envelope for {cls.__qualname__}")
+        models.append(cls.model_validate_json(frame[start:-1]))
+    return models
+
+
+def serialize_model_to_msgpack(model: BaseModel) -> bytes:
+    """Serialize a Pydantic model to MessagePack bytes.
+
+    The metadata is injected as for `serialize_model` in JSON mode, allowing
+    deserialization by `deserialize_model_from_msgpack`. This requires the
+    optional `msgspec` package.
+
+    Args:
+        model (BaseModel): The model to serialize.
+
+    Raises:
+        ImportError: If `msgspec` is not installed.
+
+    Returns:
+        bytes: A MessagePack representation of the model.
+    """
+    if msgspec is None:
+        raise ImportError("msgspec is required for MessagePack serialization")
+    dct = _serialize_model(model, json_compatible=True)
+    return _MSGPACK_ENCODER.encode(dct)
+
+
+def deserialize_model_from_msgpack(data: bytes | bytearray) -> BaseModel:
+    """Deserialize a model from MessagePack bytes.
+
+    Args:
+        data (bytes | bytearray): The MessagePack data to deserialize.
+
+    Raises:
+        ImportError: If `msgspec` is not installed.
+
+    Returns:
+        BaseModel: The deserialized Pydantic model.
+    """
+    if msgspec is None:
+        raise ImportError("msgspec is required for MessagePack serialization")
+    dct = _MSGPACK_DECODER.decode(data)
     model = _deserialize_model(dct)
     return model
 
 
-def validate_model(value: BaseModel | dict | str, info: ValidationInfo) -> BaseModel:
+# Handlers keyed by the exact type of the value, so the common cases take a
+# single dictionary lookup. Subclasses fall back to `isinstance` checks.
+_PYTHON_DISPATCH: dict[type, Callable[..., BaseModel]] = {
+    dict: _deserialize_model,
+}
+_JSON_DISPATCH: dict[type, Callable[..., BaseModel]] = {
+    str: deserialize_model_from_json,
+    bytes: deserialize_model_from_json,
+    bytearray: deserialize_model_from_json,
+    dict: _deserialize_model,
+}
+
+
+def _validate_python(
+        value: BaseModel | dict,
+        info: ValidationInfo
+) -> BaseModel:
+    """Validate a pydantic model in python mode.
+
+    Args:
+        value (BaseModel | dict): The model value to validate.
+        info (ValidationInfo): Information about the validation state.
+
+    Raises:
+        ValueError: If the value cannot be validated.
+
+    Returns:
+        BaseModel: The validated model.
+    """
+    handler = _PYTHON_DISPATCH.get(type(value))
+    if handler is None:
+        # The instance check on pydantic models is relatively expensive, so it
+        # is only made once the dictionary lookup has missed.
+        if isinstance(value, BaseModel):
+            return value
+        elif isinstance(value, dict):
+            handler = _deserialize_model
+        else:
+            raise ValueError(
+                f"unhandled type for mode {info.mode}: {type(value)}"
+            )
+    trusted = bool(info.context and info.context.get('trusted'))
+    return handler(value, trusted=trusted)
+
+
+def _validate_json(
+        value: dict | str | bytes | bytearray,
+        info: ValidationInfo
+) -> BaseModel:
+    """Validate a pydantic model in JSON mode.
+
+    Args:
+        value (dict | str | bytes | bytearray): The model value to validate.
+        info (ValidationInfo): Information about the validation state.
+
+    Raises:
+        ValueError: If the value cannot be validated.
+
+    Returns:
+        BaseModel: The validated model.
+    """
+    handler = _JSON_DISPATCH.get(type(value))
+    if handler is None:
+        if isinstance(value, (str, bytes, bytearray)):
+            handler = deserialize_model_from_json
+        elif isinstance(value, dict):
+            handler = _deserialize_model
+        else:
+            raise ValueError(
+                f"unhandled type for mode {info.mode}: {type(value)}"
+            )
+    return handler(value)
+
+
+_MODE_HANDLERS: dict[str, ModelValidatorFunction] = {
+    'python': _validate_python,
+    'json': _validate_json,
+}
+
+
+def validate_model(
+        value: BaseModel | dict | str | bytes | bytearray,
+        info: ValidationInfo
+) -> BaseModel:
     """Validate a pydantic model.
 
     This can be used in combination with `serialize_model` in the following way:
@@ -102,8 +598,14 @@ def validate_model(value: BaseModel | dict | str, info: ValidationInfo) -> BaseM
         ]
     ```
 
+    In python mode, validation of dictionaries can be skipped for trusted data
+    by passing `context={'trusted': True}` (see `_deserialize_model` for the
+    safety contract). This is ignored in JSON mode, as the values would still
+    need to be coerced from their JSON representations.
+
     Args:
-        value (BaseModel | dict | str): The model value to validate.
+        value (BaseModel | dict | str | bytes | bytearray): The model value to
+            validate.
         info (ValidationInfo): Information about the validation state.
 
     Raises:
@@ -112,31 +614,78 @@ def validate_model(value: BaseModel | dict | str, info: ValidationInfo) -> BaseM
     Returns:
         BaseModel: The validated model.
     """
+    handler = _MODE_HANDLERS.get(info.mode)
+    if handler is None:
+        raise ValueError(f"Invalid mode: {info.mode}")
+    return handler(value, info)
+
+
+def make_model_validator(target: type[BaseModel]) -> ModelValidatorFunction:
+    """Make a validator specialized for a target model class.
 
-    match info.mode:
+    Values whose type is exactly the target class are returned directly,
+    otherwise validation is dispatched on the mode as for `validate_model`,
+    and the result must be an instance of the target class. Validators are
+    cached per target class.
 
-        case 'python':
+    Args:
+        target (type[BaseModel]): The model class expected by the field.
 
-            if isinstance(value, BaseModel):
-                return value
-            elif isinstance(value, dict):
-                return _deserialize_model(value)
-            else:
-                raise ValueError(
-                    f"unhandled type for mode {info.mode}: {type(value)}"
-                )
+    Returns:
+        ModelValidatorFunction: The validator function.
+    """
+    validator = _MODEL_VALIDATORS.get(target)
+    if validator is not None:
+        return validator
+
+    # Every model is a BaseModel, so there is nothing to check for an
+    # unparametrized generic.
+    check_target = target is not BaseModel
+
+    def validator(value: Any, info: ValidationInfo) -> BaseModel:
+        if type(value) is target:
+            return value
+        handler = _MODE_HANDLERS.get(info.mode)
+        if handler is None:
+            raise ValueError(f"Invalid mode: {info.mode}")
+        model = handler(value, info)
+        if check_target and not isinstance(model, target):
+            raise ValueError(
+                f"expected {target.__qualname__}, got {type(model).__qualname__}"
+            )
+        return model
 
-        case 'json':
+    _MODEL_VALIDATORS[target] = validator
+    return validator
 
-            if isinstance(value, str):
-                return deserialize_model_from_json(value)
-            elif isinstance(value, dict):
-                return _deserialize_model(value)
-            else:
-                raise ValueError(
-                    f"unhandled type for mode {info.mode}: {type(value)}"
-                )
 
-        case _:
+class ModelValidator:
+    """An annotation to validate a generic model field.
 
-            raise ValueError(f"Invalid mode: {info.mode}")
+    This behaves like `PlainValidator(validate_model)`, but the validator is
+    specialized for the field type when pydantic builds the schema, so each
+    parametrization of a generic model (e.g. `Update[User]`) gets its own
+    validator.
+
+    ```python
+    class Update[T: BaseModel](BaseModel):
+        model: Annotated[
+            T,
+            PlainSerializer(serialize_model),
+            ModelValidator()
+        ]
+    ```
+    """
+
+    def __get_pydantic_core_schema__(
+            self,
+            source_type: Any,
+            handler: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        target = source_type
+        if isinstance(target, TypeVar):
+            target = target.__bound__
+        if not isinstance(target, type):
+            target = BaseModel
+        validator = PlainValidator(make_model_validator(target))
+        return validator.__get_pydantic_core_schema__(source_type, handler)
@@ -1,13 +1,30 @@
 from datetime import datetime
 from decimal import Decimal
+import json
+from typing import Any
+
+import pytest
+from pydantic import BaseModel, ValidationError
 
 from demo.models import User, Location, Update
 from demo.serialization import (
     serialize_model_to_json,
-    deserialize_model_from_json
+    serialize_model_to_json_bytes,
+    serialize_model_to_msgpack,
+    deserialize_many,
+    deserialize_model_from_json,
+    deserialize_model_from_msgpack
 )
 
 
+class Empty(BaseModel):
+    pass
+
+
+class Bag(BaseModel):
+    items: dict[str, Any]
+
+
 def test_serialization() -> None:
 
     user = User(
@@ -34,6 +51,241 @@ def test_serialization() -> None:
     assert update == deserialized_update
 
 
+def test_serialization_bytes() -> None:
+
+    user = User(
+        name='John Doe',
+        date_of_birth=datetime(1990, 1, 1),
+        height=1.75
+    )
+    update = Update(model=user)
+    update_json_bytes = serialize_model_to_json_bytes(update)
+    assert isinstance(update_json_bytes, bytes)
+    deserialized_update = deserialize_model_from_json(update_json_bytes)
+    assert update == deserialized_update
+
+
+def test_serialization_formats() -> None:
+
+    user = User(
+        name='John Doe',
+        date_of_birth=datetime(1990, 1, 1),
+        height=1.75
+    )
+    update = Update(model=user)
+
+    update_json_str = serialize_model_to_json(update)
+    assert update_json_str.startswith('{"$t":"demo.models:Update","v":')
+
+    # Envelopes with whitespace are parsed in full.
+    update_json_str = json.dumps(json.loads(update_json_str), indent=2)
+    assert deserialize_model_from_json(update_json_str) == update
+
+    # Envelopes with other keys after the model are parsed in full.
+    update_json_str = json.dumps(
+        {**json.loads(update_json_str), 'x': 1},
+        separators=(',', ':')
+    )
+    assert deserialize_model_from_json(update_json_str) == update
+
+    # The format with the metadata at the root of the model.
+    update_json_str = json.dumps(
+        {
+            'model': {
+                'name': 'John Doe',
+                'date_of_birth': '1990-01-01T00:00:00',
+                'height': 1.75,
+                '__module__': 'demo.models',
+                '__qualname__': 'User'
+            },
+            '__module__': 'demo.models',
+            '__qualname__': 'Update'
+        }
+    )
+    assert deserialize_model_from_json(update_json_str) == update
+
+
+def test_serialization_nested_envelope() -> None:
+
+    user = User(
+        name='John Doe',
+        date_of_birth=datetime(1990, 1, 1),
+        height=1.75
+    )
+    update = Update(model=user)
+    user_json_str = serialize_model_to_json(user)
+
+    deserialized_update = Update.model_validate(
+        {'model': json.loads(user_json_str)}
+    )
+    assert update == deserialized_update
+
+    deserialized_update = Update.model_validate_json(
+        '{"model":' + user_json_str + '}'
+    )
+    assert update == deserialized_update
+
+    with pytest.raises(ValidationError):
+        Update.model_validate({'model': {'name': 'John Doe'}})
+
+
+def test_serialization_not_a_model() -> None:
+
+    with pytest.raises(ValueError):
+        deserialize_model_from_json('{"$t":"demo.models:datetime","v":{}}')
+
+    with pytest.raises(ValueError):
+        deserialize_model_from_json('{"$t":"demo.models.User","v":{}}')
+
+    with pytest.raises(ValueError):
+        deserialize_model_from_json('{"$t":"no.such.module:User","v":{}}')
+
+    with pytest.raises(ValidationError):
+        Update.model_validate(
+            {'model': {'__module__': 'demo.models', '__qualname__': 'Nope'}}
+        )
+
+
+def test_serialization_empty() -> None:
+
+    empty = Empty()
+    empty_json_str = serialize_model_to_json(empty)
+    deserialized_empty = deserialize_model_from_json(empty_json_str)
+    assert empty == deserialized_empty
+
+    empty_json_str = json.dumps(
+        {
+            '__module__': 'tests.test_serialization',
+            '__qualname__': 'Empty'
+        }
+    )
+    deserialized_empty = deserialize_model_from_json(empty_json_str)
+    assert empty == deserialized_empty
+
+
+def test_deserialize_many() -> None:
+
+    users = [
+        User(
+            name=name,
+            date_of_birth=datetime(1990, 1, 1),
+            height=1.75
+        )
+        for name in ('John Doe', 'Jane Doe')
+    ]
+    frames = [serialize_model_to_json_bytes(user) for user in users]
+    assert deserialize_many(frames, User) == users
+
+    with pytest.raises(ValueError):
+        deserialize_many(frames, Location)
+
+    # A frame holding more than one model is rejected.
+    payloads = [user.model_dump_json().encode() for user in users]
+    frame = b'{"$t":"demo.models:User","v":' + b','.join(payloads) + b'}'
+    with pytest.raises(ValidationError):
+        deserialize_many([frame], User)
+
+
+def test_serialization_msgpack() -> None:
+    pytest.importorskip('msgspec')
+
+    location = Location(
+        name='Central Park',
+        latitude=Decimal('40.785091'),
+        longitude=Decimal('-73.968285')
+    )
+    update = Update(model=location)
+    update_msgpack = serialize_model_to_msgpack(update)
+    deserialized_update = deserialize_model_from_msgpack(update_msgpack)
+    assert update == deserialized_update
+
+
+def test_generic() -> None:
+
+    user = User(
+        name='John Doe',
+        date_of_birth=datetime(1990, 1, 1),
+        height=1.75
+    )
+    update = Update[User](model=user)
+    update_json_str = update.model_dump_json()
+    deserialized_update = Update[User].model_validate_json(update_json_str)
+    assert update == deserialized_update
+    assert deserialized_update.model == user
+
+    # The model may also be supplied as an embedded JSON string.
+    user_json_str = serialize_model_to_json(user)
+    update_json_str = json.dumps({'model': user_json_str})
+    deserialized_update = Update[User].model_validate_json(update_json_str)
+    assert update == deserialized_update
+
+    location = Location(
+        name='Central Park',
+        latitude=Decimal('40.785091'),
+        longitude=Decimal('-73.968285')
+    )
+    location_dct = Update(model=location).model_dump()['model']
+    with pytest.raises(ValidationError):
+        Update[User].model_validate({'model': location_dct})
+    with pytest.raises(ValidationError):
+        Update[User](model=location)
+
+
+def test_update_frozen() -> None:
+
+    user = User(
+        name='John Doe',
+        date_of_birth=datetime(1990, 1, 1),
+        height=1.75
+    )
+    update = Update(model=user)
+    with pytest.raises(ValidationError):
+        update.model = user
+
+
+def test_trusted() -> None:
+
+    user = User(
+        name='John Doe',
+        date_of_birth=datetime(1990, 1, 1),
+        height=1.75
+    )
+    update = Update(model=user)
+    dct = update.model_dump()
+    assert dct['model']['date_of_birth'] == datetime(1990, 1, 1)
+    deserialized_update = Update.model_validate(dct, context={'trusted': True})
+    assert update == deserialized_update
+
+    dct = update.model_dump(mode='json')
+    assert dct['model']['date_of_birth'] == '1990-01-01T00:00:00'
+    assert Update.model_validate(dct) == update
+
+    # Trusted data is not validated.
+    dct = {
+        'model': {
+            'street': 5,
+            'city': 'New York',
+            '__module__': 'demo.models',
+            '__qualname__': 'Address'
+        }
+    }
+    deserialized_update = Update.model_validate(dct, context={'trusted': True})
+    assert deserialized_update.model.street == 5
+    assert dct['model']['__qualname__'] == 'Address'
+
+    # Plain dictionaries which look like model metadata are left alone.
+    items = {'__module__': 'no.such.module', '__qualname__': 'Nope'}
+    dct = {
+        'model': {
+            'items': items,
+            '__module__': 'tests.test_serialization',
+            '__qualname__': 'Bag'
+        }
+    }
+    deserialized_update = Update.model_validate(dct, context={'trusted': True})
+    assert deserialized_update.model.items == items
+
+
 def test_model() -> None:
     user = User(
         name='John Doe',